@@ -1,30 +1,175 @@
 
 import re
 import json
-import os
+import sys
+from decimal import Decimal
 
 # Read translations.ts
 try:
     with open('translations.ts', 'r', encoding='utf-8') as f:
         content = f.read()
 except FileNotFoundError:
-    print("translations.ts not found in root")
+    print("translations.ts not found in root", file=sys.stderr)
     exit(1)
 
-# Simple parsing logic
-js_content = content.replace("import { Language } from './types';", "")
-js_content = js_content.replace("export const translations =", "const translations =")
-js_content += "\nmodule.exports = { translations };"
+# Strip the TS module wrapper down to the bare object literal; only import
+# statements at the top of the file are removed, never keys like importData.
+# An import ends at its module specifier, with or without a trailing ';'.
+_HEADER = re.compile(
+    r"\A(?:\s+|//[^\n]*|/\*.*?\*/"
+    r"|import\b[^'\"]*?(['\"])[^'\"\n]*\1[ \t]*;?)*",
+    re.S,
+)
+js_content = _HEADER.sub("", content, count=1)
+js_content = re.sub(r"export\s+const\s+translations\s*=\s*", "", js_content, count=1)
+js_content = js_content.strip().rstrip(';')
 
-# Use .cjs extension to force CommonJS
-with open('translations.ts_converted.cjs', 'w', encoding='utf-8') as f:
-    f.write(js_content)
+# Minimal parser for the JS object literal subset used in translations.ts:
+# objects, arrays, quoted/template strings, numbers, true/false/null,
+# bare identifier keys, comments and trailing commas.
+_SKIP = re.compile(r"(?:\s+|//[^\n]*|/\*.*?\*/)*", re.S)
+_IDENT = re.compile(r"[A-Za-z_$][\w$]*")
+_NUMBER = re.compile(r"-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+_LITERALS = {'true': True, 'false': False, 'null': None}
+_LONE_SURROGATE = re.compile('[\ud800-\udfff]')
 
-# Node script wrapper
-node_script = """
-const { translations } = require('./translations.ts_converted.cjs');
-console.log(JSON.stringify(translations, null, 2));
-"""
 
-with open('migrate_dumper.cjs', 'w', encoding='utf-8') as f:
-    f.write(node_script)
+class JsLiteralParser:
+    def __init__(self, src):
+        self.src = src
+        self.pos = 0
+
+    def error(self, msg):
+        line = self.src.count('\n', 0, self.pos) + 1
+        raise ValueError(f"{msg} at line {line}")
+
+    def skip(self):
+        self.pos = _SKIP.match(self.src, self.pos).end()
+
+    def peek(self):
+        self.skip()
+        if self.pos >= len(self.src):
+            self.error("Unexpected end of input")
+        return self.src[self.pos]
+
+    def at_end(self):
+        self.skip()
+        return self.pos >= len(self.src)
+
+    def expect(self, ch):
+        if self.peek() != ch:
+            self.error(f"Expected '{ch}'")
+        self.pos += 1
+
+    def parse(self):
+        value = self.value()
+        if not self.at_end():
+            self.error("Unexpected trailing content")
+        return value
+
+    def value(self):
+        ch = self.peek()
+        if ch == '{':
+            return self.obj()
+        if ch == '[':
+            return self.array()
+        if ch in '\'"`':
+            return self.string()
+        m = _NUMBER.match(self.src, self.pos)
+        if m:
+            self.pos = m.end()
+            # JS has a single number type: JSON.stringify prints integral values
+            # below 1e21 as plain digits (shortest round-trip digits, zero-padded)
+            number = float(m.group())
+            if number.is_integer() and abs(number) < 1e21:
+                return int(Decimal(repr(number)))
+            return number
+        m = _IDENT.match(self.src, self.pos)
+        if m and m.group() in _LITERALS:
+            self.pos = m.end()
+            return _LITERALS[m.group()]
+        self.error("Unsupported value")
+
+    def obj(self):
+        self.expect('{')
+        result = {}
+        while self.peek() != '}':
+            if self.peek() in '\'"':
+                key = self.string()
+            else:
+                m = _IDENT.match(self.src, self.pos) or _NUMBER.match(self.src, self.pos)
+                if not m:
+                    self.error("Expected key")
+                key = m.group()
+                self.pos = m.end()
+            self.expect(':')
+            result[key] = self.value()
+            if self.peek() != ',':
+                break
+            self.pos += 1
+        self.expect('}')
+        return result
+
+    def array(self):
+        self.expect('[')
+        result = []
+        while self.peek() != ']':
+            result.append(self.value())
+            if self.peek() != ',':
+                break
+            self.pos += 1
+        self.expect(']')
+        return result
+
+    def string(self):
+        quote = self.src[self.pos]
+        self.pos += 1
+        out = []
+        while True:
+            if self.pos >= len(self.src):
+                self.error("Unterminated string")
+            ch = self.src[self.pos]
+            self.pos += 1
+            if ch == quote:
+                # Recombine \uD83D\uDE00-style surrogate pairs; lone ones are kept
+                text = ''.join(out).encode('utf-16', 'surrogatepass')
+                return text.decode('utf-16', 'surrogatepass')
+            if quote == '`' and ch == '$' and self.src.startswith('{', self.pos):
+                self.error("Template interpolation is not supported")
+            if ch != '\\':
+                out.append(ch)
+                continue
+            if self.pos >= len(self.src):
+                self.error("Unterminated string")
+            esc = self.src[self.pos]
+            self.pos += 1
+            if esc in _ESCAPES:
+                out.append(_ESCAPES[esc])
+            elif esc == 'x':
+                out.append(chr(int(self.src[self.pos:self.pos + 2], 16)))
+                self.pos += 2
+            elif esc == 'u' and self.src.startswith('{', self.pos):
+                end = self.src.index('}', self.pos)
+                out.append(chr(int(self.src[self.pos + 1:end], 16)))
+                self.pos = end + 1
+            elif esc == 'u':
+                out.append(chr(int(self.src[self.pos:self.pos + 4], 16)))
+                self.pos += 4
+            elif esc == '\n':
+                pass  # line continuation
+            else:
+                out.append(esc)
+
+
+try:
+    translations = JsLiteralParser(js_content).parse()
+except ValueError as e:
+    print(f"Could not parse translations.ts: {e}", file=sys.stderr)
+    exit(1)
+
+# Same output as the old `node migrate_dumper.cjs` (JSON.stringify(..., null, 2)),
+# which escapes lone surrogates as \udXXX instead of failing to encode them.
+# Only fractional numbers in exponent form (1e-7) print differently from JS.
+output = json.dumps(translations, indent=2, ensure_ascii=False)
+print(_LONE_SURROGATE.sub(lambda m: f"\\u{ord(m.group()):04x}", output))
@@ -1,40 +1,51 @@
 
-import json
 import os
+from concurrent.futures import ThreadPoolExecutor
+
+from translation_json import load_json, dump_json
 
 langs = ['EN', 'PL', 'DE', 'AR', 'JA']
 lc_map = {'EN': 'en', 'PL': 'pl', 'DE': 'de', 'AR': 'ar', 'JA': 'ja'}
+_REQUIRED_LANGS = frozenset(('EN', 'PL'))
+_LANG_KEYS = frozenset(langs)
 
-with open('scripts/full_translations.json', 'r') as f:
-    full = json.load(f)
+full = load_json('scripts/full_translations.json')
 
 # Structure: full[section][key] = { EN: '...', PL: '...' }
 # Target: en/translation.json -> { section: { key: '...' } }
 
-def deep_get_lang(obj, target_lang):
+# Walks the tree once and returns { lang: subtree } for every language
+def split_all(obj, langs):
     if isinstance(obj, dict):
-        # Check if this node is a language leaf node (has EN, PL keys)
-        if 'EN' in obj and 'PL' in obj:
-            return obj.get(target_lang, "")
+        # Check if this node is a language leaf node: it has the EN, PL keys,
+        # or holds nothing but language codes (e.g. a leaf missing PL)
+        if obj.keys() >= _REQUIRED_LANGS or (obj and obj.keys() <= _LANG_KEYS):
+            return {lang: obj.get(lang, "") for lang in langs}
         
         # Otherwise recurse
-        new_obj = {}
+        out = {lang: {} for lang in langs}
         for k, v in obj.items():
-            val = deep_get_lang(v, target_lang)
-            if val is not None:
-                new_obj[k] = val
-        return new_obj
-    return obj
+            sub = split_all(v, langs)
+            for lang in langs:
+                # Drop keys that resolve to None in this language only
+                if sub[lang] is not None:
+                    out[lang][k] = sub[lang]
+        return out
+    return {lang: obj for lang in langs}
+
+split = split_all(full, langs)
 
-for lang in langs:
+def _write_lang(lang):
     lc = lc_map[lang]
-    lang_data = deep_get_lang(full, lang)
     
     # Ensure dir exists
     path = f'public/locales/{lc}'
     os.makedirs(path, exist_ok=True)
     
-    with open(f'{path}/translation.json', 'w', encoding='utf-8') as f:
-        json.dump(lang_data, f, indent=2, ensure_ascii=False)
+    dump_json(split[lang], f'{path}/translation.json')
+
+# Each language writes to its own file, so they can run side by side
+with ThreadPoolExecutor(max_workers=len(langs)) as ex:
+    list(ex.map(_write_lang, langs))
 
 print("Split complete.")
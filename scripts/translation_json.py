@@ -0,0 +1,44 @@
+
+import json
+import os
+
+# orjson serializes in C; fall back to the stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(path):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def dump_json(data, path):
+    # Same layout as json.dump(indent=2, ensure_ascii=False)
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+    # Leave the file (and its mtime) alone when nothing changed
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == payload:
+                return False
+    except FileNotFoundError:
+        pass
+
+    # Raw os.write of the serialized bytes, no buffered file object;
+    # 0o666 lets the umask pick the mode, as open(path, 'w') did
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    return True
@@ -1,6 +1,5 @@
 
-import json
-import os
+from translation_json import load_json, dump_json
 
 new_keys = {
   "assessment": {
@@ -323,22 +322,25 @@ new_keys = {
 }
 
 path = 'scripts/full_translations.json'
-with open(path, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+data = load_json(path)
 
-# Helper for recursive update
+# Helper for nested update; only descends into dicts present on both sides
+# and only assigns keys whose value actually differs
 def deep_update(source, overrides):
-    for key, value in overrides.items():
-        if isinstance(value, dict) and value:
-            returned = deep_update(source.get(key, {}), value)
-            source[key] = returned
-        else:
-            source[key] = overrides[key]
+    stack = [(source, overrides)]
+    while stack:
+        src, over = stack.pop()
+        for key, value in over.items():
+            current = src.get(key)
+            if isinstance(value, dict) and value and isinstance(current, dict):
+                stack.append((current, value))
+            elif current != value:
+                src[key] = value
     return source
 
 deep_update(data, new_keys)
 
-with open(path, 'w', encoding='utf-8') as f:
-    json.dump(data, f, indent=2, ensure_ascii=False)
-
-print("Updated translations successfully for assessment.")
+if not dump_json(data, path):
+    print("Translations already up to date.")
+else:
+    print("Updated translations successfully for assessment.")
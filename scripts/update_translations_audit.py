@@ -1,6 +1,5 @@
 
-import json
-import os
+from translation_json import load_json, dump_json
 
 new_keys = {
   "sidebar": {
@@ -123,8 +122,7 @@ new_keys = {
 }
 
 path = 'scripts/full_translations.json'
-with open(path, 'r', encoding='utf-8') as f:
-    data = json.load(f)
+data = load_json(path)
 
 # Update sidebar
 if 'sidebar' not in data:
@@ -136,7 +134,7 @@ if 'common' not in data:
     data['common'] = {}
 data['common'].update(new_keys['common'])
 
-with open(path, 'w', encoding='utf-8') as f:
-    json.dump(data, f, indent=2, ensure_ascii=False)
-
-print("Updated translations successfully.")
+if not dump_json(data, path):
+    print("Translations already up to date.")
+else:
+    print("Updated translations successfully.")
@@ -0,0 +1,134 @@
+/**
+ * prepare_migration.py Unit Tests
+ * Converts translations.ts to JSON without going through Node
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const SCRIPT = path.resolve(__dirname, '../../scripts/prepare_migration.py');
+
+describe('prepare_migration.py', () => {
+    let tmpDir;
+
+    const run = (source) => {
+        if (source !== null) {
+            fs.writeFileSync(path.join(tmpDir, 'translations.ts'), source);
+        }
+        return spawnSync('python3', [SCRIPT], { cwd: tmpDir, encoding: 'utf8' });
+    };
+
+    beforeEach(() => {
+        tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'prepare-migration-'));
+    });
+
+    afterEach(() => {
+        fs.rmSync(tmpDir, { recursive: true, force: true });
+    });
+
+    it('should strip only the leading import, not keys starting with import', () => {
+        const result = run([
+            "import { Language } from './types';",
+            'export const translations = {',
+            "  importData: 'Import data',",
+            "  common: { import: 'Import', save: \"Save\" },",
+            '};',
+            '',
+        ].join('\n'));
+
+        expect(result.status).toBe(0);
+        expect(JSON.parse(result.stdout)).toEqual({
+            importData: 'Import data',
+            common: { import: 'Import', save: 'Save' },
+        });
+    });
+
+    it('should strip imports without a trailing semicolon', () => {
+        const result = run([
+            "import { Language } from './types'",
+            'import {',
+            '    Other,',
+            '} from "./other"',
+            '',
+            'export const translations = {',
+            "  a: 'x; y',",
+            '  b: 1,',
+            '};',
+        ].join('\n'));
+
+        expect(result.status).toBe(0);
+        expect(JSON.parse(result.stdout)).toEqual({ a: 'x; y', b: 1 });
+    });
+
+    it('should match JSON.stringify for comments, template strings and escapes', () => {
+        const result = run([
+            'export const translations = {',
+            '  // comment',
+            "  a: 'it\\'s \\x41 \\u{1F600}',",
+            '  b: `multi',
+            'line`,',
+            '  list: [1, 2.5, 3e2, true, null,],',
+            '};',
+        ].join('\n'));
+
+        expect(result.status).toBe(0);
+        expect(result.stdout).toBe(JSON.stringify({
+            a: "it's A \u{1F600}",
+            b: 'multi\nline',
+            list: [1, 2.5, 300, true, null],
+        }, null, 2) + '\n');
+    });
+
+    it('should escape lone surrogates like JSON.stringify', () => {
+        const result = run("export const translations = { a: 'x \\uD83D y' };");
+
+        expect(result.status).toBe(0);
+        expect(result.stdout).toBe(JSON.stringify({ a: 'x \uD83D y' }, null, 2) + '\n');
+    });
+
+    it('should report malformed input on stderr without a traceback', () => {
+        const result = run("export const translations = { a: 'x\\");
+
+        expect(result.status).toBe(1);
+        expect(result.stdout).toBe('');
+        expect(result.stderr).toContain('Could not parse translations.ts: Unterminated string');
+        expect(result.stderr).not.toContain('Traceback');
+    });
+
+    it('should report a truncated object as unexpected end of input', () => {
+        const sources = [
+            "export const translations = { a: 'x',",
+            'export const translations = { a:',
+            'export const translations =',
+        ];
+
+        sources.forEach(source => {
+            const result = run(source);
+            expect(result.status).toBe(1);
+            expect(result.stdout).toBe('');
+            expect(result.stderr).toContain('Could not parse translations.ts: Unexpected end of input');
+            expect(result.stderr).not.toContain('Traceback');
+        });
+    });
+
+    it('should print integral numbers the way JSON.stringify does', () => {
+        const result = run('export const translations = { n: [1e21, 123456789012345678901, 2e20, -0, 1.5] };');
+
+        expect(result.status).toBe(0);
+        expect(result.stdout).toBe(JSON.stringify({
+            n: [1e21, 123456789012345678901, 2e20, -0, 1.5],
+        }, null, 2) + '\n');
+    });
+
+    it('should keep stdout empty when translations.ts is missing', () => {
+        const result = run(null);
+
+        expect(result.status).toBe(1);
+        expect(result.stdout).toBe('');
+        expect(result.stderr).toContain('translations.ts not found');
+    });
+});
@@ -0,0 +1,109 @@
+/**
+ * split_translations.py Unit Tests
+ * Splits scripts/full_translations.json into per-language locale files
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const SCRIPT = path.resolve(__dirname, '../../scripts/split_translations.py');
+const LOCALES = ['en', 'pl', 'de', 'ar', 'ja'];
+
+describe('split_translations.py', () => {
+    let tmpDir;
+
+    const localePath = (lc) => path.join(tmpDir, 'public/locales', lc, 'translation.json');
+
+    const run = (full) => {
+        fs.mkdirSync(path.join(tmpDir, 'scripts'), { recursive: true });
+        fs.writeFileSync(path.join(tmpDir, 'scripts/full_translations.json'), JSON.stringify(full));
+        return spawnSync('python3', [SCRIPT], { cwd: tmpDir, encoding: 'utf8' });
+    };
+
+    const readLocales = () => Object.fromEntries(
+        LOCALES.map(lc => [lc, JSON.parse(fs.readFileSync(localePath(lc), 'utf8'))])
+    );
+
+    beforeEach(() => {
+        tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'split-translations-'));
+    });
+
+    afterEach(() => {
+        fs.rmSync(tmpDir, { recursive: true, force: true });
+    });
+
+    it('should write one locale file per language', () => {
+        const result = run({
+            common: { save: { EN: 'Save', PL: 'Zapisz', DE: 'Speichern', AR: 'حفظ', JA: '保存' } },
+        });
+
+        expect(result.status).toBe(0);
+        const locales = readLocales();
+        expect(locales.en).toEqual({ common: { save: 'Save' } });
+        expect(locales.pl).toEqual({ common: { save: 'Zapisz' } });
+        expect(locales.ja).toEqual({ common: { save: '保存' } });
+    });
+
+    it('should omit a key only for the language whose value is null', () => {
+        const result = run({
+            s: { k: { EN: 'a', PL: 'b', DE: null, AR: 'c', JA: 'd' } },
+        });
+
+        expect(result.status).toBe(0);
+        const locales = readLocales();
+        expect(locales.de).toEqual({ s: {} });
+        expect(locales.en).toEqual({ s: { k: 'a' } });
+        expect(locales.pl).toEqual({ s: { k: 'b' } });
+        expect(locales.ar).toEqual({ s: { k: 'c' } });
+    });
+
+    it('should treat a language-only dict without PL as a leaf', () => {
+        const result = run({ s: { k: { EN: 'x' } } });
+
+        expect(result.status).toBe(0);
+        const locales = readLocales();
+        expect(locales.en).toEqual({ s: { k: 'x' } });
+        ['pl', 'de', 'ar', 'ja'].forEach(lc => {
+            expect(locales[lc]).toEqual({ s: { k: '' } });
+        });
+    });
+
+    it('should recurse into a section whose first child is a string', () => {
+        const result = run({
+            s: {
+                title: 'Plain',
+                nested: { EN: 'Hello', PL: 'Cześć', DE: 'Hallo', AR: 'مرحبا', JA: 'こんにちは' },
+            },
+        });
+
+        expect(result.status).toBe(0);
+        const locales = readLocales();
+        expect(locales.en).toEqual({ s: { title: 'Plain', nested: 'Hello' } });
+        expect(locales.de).toEqual({ s: { title: 'Plain', nested: 'Hallo' } });
+    });
+
+    it('should leave unchanged locale files untouched on re-run', () => {
+        const full = {
+            common: { save: { EN: 'Save', PL: 'Zapisz', DE: 'Speichern', AR: 'حفظ', JA: '保存' } },
+        };
+        expect(run(full).status).toBe(0);
+
+        const stale = new Date(1000 * 1000);
+        LOCALES.forEach(lc => fs.utimesSync(localePath(lc), stale, stale));
+
+        expect(run(full).status).toBe(0);
+        LOCALES.forEach(lc => {
+            expect(fs.statSync(localePath(lc)).mtimeMs).toBe(stale.getTime());
+        });
+
+        full.common.save.EN = 'Save changes';
+        expect(run(full).status).toBe(0);
+        expect(fs.statSync(localePath('en')).mtimeMs).not.toBe(stale.getTime());
+        expect(fs.statSync(localePath('pl')).mtimeMs).toBe(stale.getTime());
+        expect(readLocales().en).toEqual({ common: { save: 'Save changes' } });
+    });
+});
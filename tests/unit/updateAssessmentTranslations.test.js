@@ -0,0 +1,80 @@
+/**
+ * update_assessment_translations.py Unit Tests
+ * Merges the assessment keys into scripts/full_translations.json
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { spawnSync } = require('child_process');
+
+const SCRIPT = path.resolve(__dirname, '../../scripts/update_assessment_translations.py');
+
+describe('update_assessment_translations.py', () => {
+    let tmpDir;
+    let fullPath;
+
+    const run = () => spawnSync('python3', [SCRIPT], { cwd: tmpDir, encoding: 'utf8' });
+    const readFull = () => JSON.parse(fs.readFileSync(fullPath, 'utf8'));
+
+    beforeEach(() => {
+        tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), 'update-assessment-'));
+        fs.mkdirSync(path.join(tmpDir, 'scripts'));
+        fullPath = path.join(tmpDir, 'scripts/full_translations.json');
+    });
+
+    afterEach(() => {
+        fs.rmSync(tmpDir, { recursive: true, force: true });
+    });
+
+    it('should merge new keys while keeping unrelated ones', () => {
+        fs.writeFileSync(fullPath, JSON.stringify({
+            common: { save: { EN: 'Save', PL: 'Zapisz' } },
+            assessment: {
+                workspace: {
+                    header: { EN: 'Old header', PL: 'Stary nagłówek' },
+                    custom: { EN: 'Custom', PL: 'Własny' },
+                },
+            },
+        }));
+
+        const result = run();
+
+        expect(result.status).toBe(0);
+        expect(result.stdout).toContain('Updated translations successfully for assessment.');
+        const data = readFull();
+        expect(data.common).toEqual({ save: { EN: 'Save', PL: 'Zapisz' } });
+        expect(data.assessment.workspace.custom).toEqual({ EN: 'Custom', PL: 'Własny' });
+        expect(data.assessment.workspace.header.EN).toBe('DRD Assessment');
+        expect(data.assessment.workspace.header.JA).toBe('DRDアセスメント');
+        expect(data.assessment.wizard).toBeDefined();
+        expect(data.assessment.axisContent).toBeDefined();
+    });
+
+    it('should replace a plain value that sits where a section is expected', () => {
+        fs.writeFileSync(fullPath, JSON.stringify({ assessment: { workspace: 'legacy' } }));
+
+        const result = run();
+
+        expect(result.status).toBe(0);
+        expect(readFull().assessment.workspace.header.EN).toBe('DRD Assessment');
+    });
+
+    it('should not rewrite the file when it is already up to date', () => {
+        fs.writeFileSync(fullPath, '{}');
+        expect(run().status).toBe(0);
+        const merged = fs.readFileSync(fullPath);
+
+        const stale = new Date(1000 * 1000);
+        fs.utimesSync(fullPath, stale, stale);
+
+        const result = run();
+
+        expect(result.status).toBe(0);
+        expect(result.stdout).toContain('Translations already up to date.');
+        expect(fs.readFileSync(fullPath).equals(merged)).toBe(true);
+        expect(fs.statSync(fullPath).mtimeMs).toBe(stale.getTime());
+    });
+});